@@ -1,7 +1,12 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
-app = FastAPI(title="Health API", version="1.0.0")
+app = FastAPI(
+    title="Health API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
 
 # Open CORS so the frontend can reach health routes in any environment
 app.add_middleware(
@@ -2,9 +2,9 @@
 echo "Starting FastAPI backend server..."
 
 # Find and kill MainThread processes
-PIDS=$(ps | grep uvicorn | grep -v grep | awk '{print $1}')
+PIDS=$(ps | grep -E 'uvicorn|gunicorn' | grep -v grep | awk '{print $1}')
 if [ ! -z "$PIDS" ]; then
-  echo "Killing uvicorn processes: $PIDS"
+  echo "Killing server processes: $PIDS"
   for pid in $PIDS; do
     kill $pid 2>/dev/null || true
   done
@@ -15,5 +15,13 @@ mkdir -p logs
 echo "Installing dependencies..."
 pip install -r requirements.txt
 echo "Starting FastAPI server..."
-nohup uvicorn main:app --host 0.0.0.0 --port 8000 --reload > logs/server.log 2>&1 
+if [ "${RELOAD:-0}" = "1" ]; then
+  # Single uvicorn process with hot reload for development; keep these
+  # flags in sync with HealthUvicornWorker.CONFIG_KWARGS in workers.py
+  nohup uvicorn main:app --host 0.0.0.0 --port ${PORT:-8000} --reload --loop uvloop --http httptools --no-access-log --no-proxy-headers --no-server-header --no-date-header > logs/server.log 2>&1 
+else
+  # uvloop/httptools and the disabled access log, proxy, server and date
+  # headers are set on the worker class in workers.py
+  nohup gunicorn main:app -k workers.HealthUvicornWorker -w ${WEB_CONCURRENCY:-4} -b 0.0.0.0:${PORT:-8000} --error-logfile - > logs/server.log 2>&1 
+fi
 echo "Server started in background"
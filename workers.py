@@ -0,0 +1,19 @@
+"""
+Gunicorn Worker
+
+Uvicorn worker used by start_server.sh. The stock UvicornWorker only sets
+loop/http, so the remaining server options are pinned here.
+"""
+
+from uvicorn.workers import UvicornWorker
+
+
+class HealthUvicornWorker(UvicornWorker):
+    CONFIG_KWARGS = {
+        "loop": "uvloop",
+        "http": "httptools",
+        "access_log": False,
+        "proxy_headers": False,
+        "server_header": False,
+        "date_header": False,
+    }